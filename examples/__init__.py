@@ -0,0 +1,51 @@
+"""Example Loopy databases.
+
+Usage:
+    import examples
+
+    tree = examples.product_catalog()
+    tree.ls("/clothing")  # -> ["mens", "womens", "kids"]
+
+Loaders are created on first attribute access (PEP 562), and each file is
+parsed once per process. Every call returns a fresh, independent copy.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+_DIR = Path(__file__).parent
+
+_EXAMPLES = {
+    "product_catalog": "E-commerce taxonomy.",
+    "knowledge_graph": "ML/CS concept ontology.",
+    "bookmarks": "Browser bookmarks.",
+    "recipes": "Recipe collection.",
+    "org_chart": "Company org chart.",
+}
+
+__all__ = list(_EXAMPLES)
+
+
+@lru_cache(maxsize=None)
+def _load(name: str):
+    """Parse an example file once per process."""
+    from loopy import Loopy
+
+    return Loopy((_DIR / f"{name}.loopy").read_text())
+
+
+def __getattr__(name: str):
+    if name not in _EXAMPLES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    def loader():
+        return _load(name).copy()
+
+    loader.__name__ = loader.__qualname__ = name
+    loader.__doc__ = _EXAMPLES[name]
+    globals()[name] = loader
+    return loader
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_EXAMPLES))
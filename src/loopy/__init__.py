@@ -12,8 +12,28 @@ Usage:
     tree.grep("mam")  # -> ["/animals/mammals"]
 """
 
+import importlib
+
 from .core_v2 import Loopy, slugify
-from .file_store import FileBackedLoopy, load, save
 
 __version__ = "0.3.0"
 __all__ = ["Loopy", "FileBackedLoopy", "load", "save", "slugify"]
+
+# file_store is imported on first access (PEP 562), so `import loopy` only
+# pays for the core engine.
+_FILE_STORE = {"FileBackedLoopy", "load", "save"}
+
+
+def __getattr__(name: str):
+    if name != "file_store" and name not in _FILE_STORE:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # import_module, not `from . import file_store`: the latter probes this
+    # __getattr__ for "file_store" first and would recurse.
+    file_store = importlib.import_module(f"{__name__}.file_store")
+    value = file_store if name == "file_store" else getattr(file_store, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _FILE_STORE | {"file_store"})
@@ -0,0 +1,67 @@
+"""Glob pattern helpers shared by both Loopy engines."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+import re
+from typing import Optional
+
+# Characters that make a glob segment non-literal (glob wildcards or raw regex)
+GLOB_META = frozenset("*?[](){}+|^$\\")
+
+# Raw regex syntax, which can match any number of path segments
+_REGEX_META = GLOB_META.difference("*?")
+
+
+@lru_cache(maxsize=256)
+def glob_to_regex(pattern: str) -> re.Pattern:
+    """Translate a glob pattern to a compiled regex (cached per pattern).
+
+    One left-to-right pass: ** -> .*, * -> [^/]*, ? -> [^/], . is escaped,
+    and everything else is passed through as regex syntax.
+    """
+    parts = ["^"]
+    i = 0
+    n = len(pattern)
+    while i < n:
+        ch = pattern[i]
+        if ch == "*":
+            if pattern.startswith("*", i + 1):
+                parts.append(".*")
+                i += 2
+                continue
+            parts.append("[^/]*")
+        elif ch == "?":
+            parts.append("[^/]")
+        elif ch == ".":
+            parts.append(r"\.")
+        else:
+            parts.append(ch)
+        i += 1
+    parts.append("$")
+    return re.compile("".join(parts))
+
+
+def glob_scope(pattern: str) -> tuple[list[str], Optional[int]]:
+    """Split an absolute glob pattern for scoping the walk.
+
+    Returns (prefix, max_depth): the pattern's literal leading segments, which
+    every match must start with, and the deepest path depth (segment count)
+    a match can have, or None if ** or raw regex syntax makes it unbounded.
+    """
+    if "|" in pattern:
+        # Regex alternation splits the whole pattern into independent
+        # branches, so no leading segment is shared by every match.
+        return [], None
+
+    segments = pattern[1:].split("/")
+    n = 0
+    while n < len(segments) and segments[n] and not GLOB_META.intersection(segments[n]):
+        n += 1
+    rest = segments[n:]
+
+    # Without ** or raw regex, each remaining segment matches exactly one
+    # path segment, so nothing deeper can match.
+    if any("**" in seg or _REGEX_META.intersection(seg) for seg in rest):
+        return segments[:n], None
+    return segments[:n], len(segments)
@@ -1,7 +1,9 @@
 """Core Loopy implementation."""
 
 import re
-from typing import Optional
+from typing import Iterator, Optional
+
+from ._glob import glob_scope, glob_to_regex
 
 # Regex pattern for valid tag names (alphanumeric, underscore, hyphen, dot)
 TAG_NAME = r"[\w.\-]+"
@@ -21,30 +23,98 @@ def _escape(text: str) -> str:
 
 def _unescape(text: str) -> str:
     """Unescape special characters when reading."""
+    if "&" not in text:
+        return text  # Common case: nothing escaped, skip the three passes
     return text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
 
 
-def _skip_tag(content: str, tag_name: str, start: int) -> int:
+# Max cached _find_node results before the cache is reset
+_FIND_CACHE_SIZE = 1024
+
+# Tag kinds returned by _next_tag
+_OPEN, _CLOSE, _EMPTY = 0, 1, 2
+
+
+def _next_tag(data: str, pos: int, end: int) -> Optional[tuple[int, int, str, int]]:
     """
-    Skip past a tag and its contents, handling nesting.
-    Returns position after the closing tag (or after /> for self-closing).
+    Find the next tag in data[pos:end] with plain str.find scanning.
+    Returns (start, stop, name, kind) where stop is just past the '>',
+    or None if there is no complete tag left.
     """
+    lt = data.find("<", pos, end)
+    if lt == -1:
+        return None
+    gt = data.find(">", lt, end)
+    if gt == -1:
+        return None
+    if data[lt + 1] == "/":
+        return lt, gt + 1, data[lt + 2 : gt], _CLOSE
+    if data[gt - 1] == "/":
+        return lt, gt + 1, data[lt + 1 : gt - 1], _EMPTY
+    return lt, gt + 1, data[lt + 1 : gt], _OPEN
+
+
+def _skip_tag(content: str, tag_name: str, start: int, end: Optional[int] = None) -> int:
+    """
+    Skip past a tag's contents, handling nesting of same-named tags.
+    start is just past the opening tag; returns position after the matching
+    closing tag (or end if it is unclosed).
+    """
+    if end is None:
+        end = len(content)
+    open_tag = f"<{tag_name}>"
     close_tag = f"</{tag_name}>"
     depth = 1
     pos = start
-    while depth > 0 and pos < len(content):
-        next_open = re.search(rf"<{re.escape(tag_name)}(/?>)", content[pos:])
-        next_close = content.find(close_tag, pos)
-        if next_close == -1:
-            return len(content)
-        if next_open and pos + next_open.start() < next_close:
-            if next_open.group(1) != "/>":
-                depth += 1
-            pos = pos + next_open.end()
+    while True:
+        close_pos = content.find(close_tag, pos, end)
+        if close_pos == -1:
+            return end
+        # Every same-named open before this close nests one level deeper
+        depth += content.count(open_tag, pos, close_pos) - 1
+        pos = close_pos + len(close_tag)
+        if depth == 0:
+            return pos
+
+
+def _rename_node_str(node_str: str, old_name: str, new_name: str) -> str:
+    """Rename the outermost tag of a serialized node (<old/> or <old>...</old>) by slicing."""
+    if node_str.startswith(f"<{old_name}/>"):
+        return f"<{new_name}/>"
+    inner = node_str[len(old_name) + 2 : len(node_str) - len(old_name) - 3]
+    return f"<{new_name}>{inner}</{new_name}>"
+
+
+def _scan_content(
+    data: str, start: int, end: int, text: bool = True
+) -> tuple[str, list[tuple[str, int, int]]]:
+    """
+    Scan a node's content region data[start:end] once.
+    Returns (text, children): the node's own text (as cat returns it) and
+    (name, content_start, content_end) for each direct child.
+    Self-closing children get an empty span. With text=False the text is
+    not assembled and "" is returned in its place.
+    """
+    text_parts = []
+    children = []
+    pos = start
+    while True:
+        tag = _next_tag(data, pos, end)
+        if tag is None or tag[3] == _CLOSE:
+            text_parts.append(data[pos:end])
+            break
+        tag_start, stop, name, kind = tag
+        if text:
+            text_parts.append(data[pos:tag_start])
+        if kind == _EMPTY:
+            children.append((name, stop, stop))
+            pos = stop
         else:
-            depth -= 1
-            pos = next_close + len(close_tag)
-    return pos
+            pos = _skip_tag(data, name, stop, end)
+            children.append((name, stop, pos - len(name) - 3))
+    if not text:
+        return "", children
+    return _unescape("".join(text_parts).strip()), children
 
 
 class Loopy:
@@ -53,6 +123,10 @@ class Loopy:
     def __init__(self, data: str = "<root/>"):
         self._data = data if data else "<root/>"
         self._cwd = "/"
+        # path -> (start, end, has_content) offsets, valid only for the _data string
+        # they were built from. Content is sliced on demand so entries stay small.
+        self._find_cache: dict[str, Optional[tuple[int, int, bool]]] = {}
+        self._find_cache_data: Optional[str] = None
 
     @property
     def cwd(self) -> str:
@@ -85,9 +159,10 @@ class Loopy:
     def cd(self, path: str = "/") -> "Loopy":
         """Change working directory. Returns self for chaining."""
         resolved = self._resolve(path)
-        if not self.exists(resolved):
+        node = self._try_find_node(resolved)
+        if node is None:
             raise KeyError(f"Path does not exist: {resolved}")
-        if not self.isdir(resolved):
+        if self._is_file_node(node):
             raise NotADirectoryError(f"Not a directory: {resolved}")
         self._cwd = resolved
         return self
@@ -120,149 +195,168 @@ class Loopy:
                     _validate_segment(seg)
         return segments
 
+    def _child_path(self, parent_path: str, child_name: str) -> str:
+        if parent_path == "/":
+            return f"/{child_name}"
+        return f"{parent_path}/{child_name}"
+
+    def _basename(self, path: str) -> str:
+        """Last segment of a resolved path ("root" for "/")."""
+        return path.rsplit("/", 1)[-1] or "root"
+
     def _find_node(self, path: str) -> tuple[int, int, bool, str]:
         """
         Find a node by path.
         Returns: (start_idx, end_idx, has_content, content)
         Raises KeyError if not found.
         """
-        segments = self._normalize_path(path)
-        if not segments:
-            # Root node
-            m = re.search(r"<root(/?>)", self._data)
-            if m:
-                if m.group(1) == "/>":
-                    return m.start(), m.end(), False, ""
-                else:
-                    end = self._data.find("</root>")
-                    return m.start(), end + 7, True, self._data[m.end():end]
-            raise KeyError(path)
+        result = self._try_find_node(path)
+        if result is None:
+            # Re-scan so the KeyError carries the specific reason
+            return self._locate(path)
+        return result
 
-        # Start search from within root's content
-        root_match = re.search(r"<root(/?>)", self._data)
-        if not root_match:
-            raise KeyError(path)
-        if root_match.group(1) == "/>":
-            raise KeyError(path)  # Root is empty, can't find anything
-        root_end = self._data.find("</root>")
-        search_start = root_match.end()
-        search_end = root_end
+    def _try_find_node(self, path: str) -> Optional[tuple[int, int, bool, str]]:
+        """
+        Like _find_node, but returns None if the path does not exist.
 
-        for i, seg in enumerate(segments):
-            # Look for self-closing or opening tag - but only DIRECT children
-            search_region = self._data[search_start:search_end]
+        Node offsets (and misses) are memoized until _data changes
+        (every mutation assigns a new string).
+        """
+        data = self._data
+        if self._find_cache_data is not data:
+            self._find_cache = {}
+            self._find_cache_data = data
+        cache = self._find_cache
+        if path in cache:
+            hit = cache[path]
+            if hit is None:
+                return None
+            start, end, has_content = hit
+            if not has_content:
+                return start, end, False, ""
+            # Content runs from after the opening tag to the closing tag at the end
+            return start, end, True, data[data.index(">", start) + 1 : data.rindex("<", start, end)]
+        try:
+            result = self._locate(path)
+        except KeyError:
+            result = None
+        if len(cache) >= _FIND_CACHE_SIZE:
+            cache.clear()
+        cache[path] = None if result is None else result[:3]
+        return result
+
+    def _locate(self, path: str) -> tuple[int, int, bool, str]:
+        """Uncached _find_node: scan self._data from the root element."""
+        segments = self._normalize_path(path)
+        depth, node = self._descend(segments)
+        if node is None or depth < len(segments):
+            raise KeyError(path)
+        return node
 
-            # Find direct child by parsing at current level only
-            match = None
-            pos = 0
-            while pos < len(search_region):
-                tag_match = re.search(rf"<({TAG_NAME})(/?>)", search_region[pos:])
-                if not tag_match:
-                    break
+    def _descend(self, segments: list[str]) -> tuple[int, Optional[tuple[int, int, bool, str]]]:
+        """
+        Follow segments down from the root element for as long as they exist.
+        Returns: (depth, node) where depth is how many segments were matched and
+        node is the deepest node reached, in _find_node's format (None if there
+        is no root element).
+        """
+        data = self._data
 
-                tag_name = tag_match.group(1)
-                tag_end_type = tag_match.group(2)
+        # Locate the root element
+        pos = 0
+        while True:
+            tag = _next_tag(data, pos, len(data))
+            if tag is None:
+                return 0, None
+            if tag[2] == "root" and tag[3] != _CLOSE:
+                break
+            pos = tag[1]
+        start, stop, name, kind = tag
+        if kind == _EMPTY:
+            return 0, (start, stop, False, "")
+        node = self._open_node(start, stop, name, len(data))
 
-                if tag_name == seg:
-                    # Found our segment as a direct child
-                    match = tag_match
-                    match_pos = pos  # Track position for absolute calculation
+        for i, seg in enumerate(segments):
+            # Find a direct child named seg within the current node's content
+            search_start = stop
+            search_end = node[1] - len(name) - 3  # the current node's closing tag
+            pos = search_start
+            while True:
+                tag = _next_tag(data, pos, search_end)
+                if tag is None or tag[3] == _CLOSE:
+                    return i, node
+                start, stop, name, kind = tag
+                if name == seg:
                     break
-
-                # Skip this tag (not our target) - need to skip its entire content
-                if tag_end_type == "/>":
-                    pos = pos + tag_match.end()
-                else:
-                    # Find matching close tag
-                    close_tag = f"</{tag_name}>"
-                    depth = 1
-                    scan = pos + tag_match.end()
-                    while depth > 0 and scan < len(search_region):
-                        next_open = re.search(rf"<{re.escape(tag_name)}(/?>)", search_region[scan:])
-                        next_close = search_region.find(close_tag, scan)
-                        if next_close == -1:
-                            break
-                        if next_open and scan + next_open.start() < next_close:
-                            if next_open.group(1) != "/>":
-                                depth += 1
-                            scan = scan + next_open.end()
-                        else:
-                            depth -= 1
-                            scan = next_close + len(close_tag)
-                    pos = scan
-
-            if not match:
-                raise KeyError(path)
-
-            abs_start = search_start + match_pos + match.start()
-
-            if match.group(2) == "/>":
-                # Self-closing tag
-                if i == len(segments) - 1:
-                    return abs_start, search_start + match_pos + match.end(), False, ""
-                else:
-                    raise KeyError(path)  # Can't traverse into self-closing
-            else:
-                # Opening tag - find closing
-                close_tag = f"</{seg}>"
-                depth = 1
-                scan_pos = search_start + match_pos + match.end()
-
-                while depth > 0:
-                    next_open = re.search(rf"<{re.escape(seg)}(/?>)", self._data[scan_pos:search_end])
-                    next_close = self._data.find(close_tag, scan_pos, search_end)
-
-                    if next_close == -1:
-                        raise KeyError(f"Malformed: unclosed <{seg}>")
-
-                    if next_open and scan_pos + next_open.start() < next_close:
-                        if next_open.group(1) != "/>":
-                            depth += 1
-                        scan_pos = scan_pos + next_open.end()
-                    else:
-                        depth -= 1
-                        if depth == 0:
-                            abs_end = next_close + len(close_tag)
-                            content_start = search_start + match_pos + match.end()
-                            content = self._data[content_start:next_close]
-
-                            if i == len(segments) - 1:
-                                return abs_start, abs_end, True, content
-                            else:
-                                # Narrow search bounds to this node's content
-                                search_start = content_start
-                                search_end = next_close
-                        else:
-                            scan_pos = next_close + len(close_tag)
-
-        raise KeyError(path)
+                pos = stop if kind == _EMPTY else _skip_tag(data, name, stop, search_end)
+
+            if kind == _EMPTY:
+                # Self-closing: can't traverse further
+                return i + 1, (start, stop, False, "")
+            node = self._open_node(start, stop, name, search_end)
+
+        return len(segments), node
+
+    def _open_node(self, start: int, stop: int, name: str, end: int) -> tuple[int, int, bool, str]:
+        """Build the _find_node result for an opening tag at data[start:stop], searching up to end."""
+        data = self._data
+        close_tag = f"</{name}>"
+        node_end = _skip_tag(data, name, stop, end)
+        close_pos = node_end - len(close_tag)
+        if not data.startswith(close_tag, close_pos):
+            raise KeyError(f"Malformed: unclosed <{name}>")
+        return start, node_end, True, data[stop:close_pos]
+
+    def _iter_children(self, content: str) -> Iterator[str]:
+        """Yield immediate child tag names from content string, scanning lazily."""
+        pos = 0
+        end = len(content)
+        while True:
+            tag = _next_tag(content, pos, end)
+            if tag is None or tag[3] == _CLOSE:
+                return
+            _, stop, name, kind = tag
+            yield name
+            pos = stop if kind == _EMPTY else _skip_tag(content, name, stop, end)
 
     def _extract_children(self, content: str) -> list[str]:
         """Extract immediate child tag names from content string."""
-        children = []
+        return list(self._iter_children(content))
+
+    def _has_text(self, content: str) -> bool:
+        """Whether content has any non-whitespace text outside child tags (i.e. cat is non-empty)."""
         pos = 0
-        while pos < len(content):
-            match = re.search(rf"<({TAG_NAME})(/?>)", content[pos:])
-            if not match:
-                break
-            name = match.group(1)
-            children.append(name)
-            if match.group(2) == "/>":
-                pos = pos + match.end()
-            else:
-                pos = _skip_tag(content, name, pos + match.end())
-        return children
+        end = len(content)
+        while True:
+            tag = _next_tag(content, pos, end)
+            if tag is None or tag[3] == _CLOSE:
+                return pos < end and not content[pos:end].isspace()
+            start, stop, name, kind = tag
+            if start > pos and not content[pos:start].isspace():
+                return True
+            pos = stop if kind == _EMPTY else _skip_tag(content, name, stop, end)
+
+    def _is_file_node(self, node: tuple[int, int, bool, str]) -> bool:
+        """Whether a _find_node result is a file: self-closing or has text content."""
+        _, _, has_content, content = node
+        return not has_content or self._has_text(content)
+
+    def _content_span(self, path: str) -> tuple[int, int]:
+        """Return (start, end) of a node's content within self._data (empty if self-closing)."""
+        _, end, has_content, content = self._find_node(path)
+        if not has_content:
+            return end, end
+        segments = self._normalize_path(path)
+        name = segments[-1] if segments else "root"
+        content_end = end - len(name) - 3  # len(f"</{name}>")
+        return content_end - len(content), content_end
 
     # --- Filesystem Operations ---
 
     def exists(self, path: str) -> bool:
         """Check if a path exists."""
-        path = self._resolve(path)
-        try:
-            self._find_node(path)
-            return True
-        except KeyError:
-            return False
+        return self._try_find_node(self._resolve(path)) is not None
 
     def ls(self, path: str = ".", classify: bool = False) -> list[str]:
         """List children of a node. Use classify=True to append / to directories (like ls -F)."""
@@ -270,17 +364,20 @@ class Loopy:
         _, _, has_content, content = self._find_node(path)
         if not has_content:
             return []
-        children = self._extract_children(content)
-        if classify:
-            result = []
-            for child in children:
-                child_path = f"{path.rstrip('/')}/{child}"
-                if self.isdir(child_path):
-                    result.append(f"{child}/")
-                else:
-                    result.append(child)
-            return result
-        return children
+        if not classify:
+            return self._extract_children(content)
+
+        # Classify from the child spans instead of looking each child up again
+        data = self._data
+        result = []
+        _, children = _scan_content(data, *self._content_span(path), text=False)
+        for child, child_start, child_end in children:
+            self_closing = data.startswith("/>", child_start - 2)
+            if self_closing or self._has_text(data[child_start:child_end]):
+                result.append(child)
+            else:
+                result.append(f"{child}/")
+        return result
 
     def cat(self, path: str) -> str:
         """Get the text content of a node (excludes child tags)."""
@@ -291,16 +388,15 @@ class Loopy:
         # Remove all child elements, keeping only direct text
         result = []
         pos = 0
-        while pos < len(content):
-            match = re.search(rf"<({TAG_NAME})(/?>)", content[pos:])
-            if not match:
+        end = len(content)
+        while True:
+            tag = _next_tag(content, pos, end)
+            if tag is None or tag[3] == _CLOSE:
                 result.append(content[pos:])
                 break
-            result.append(content[pos : pos + match.start()])
-            if match.group(2) == "/>":
-                pos = pos + match.end()
-            else:
-                pos = _skip_tag(content, match.group(1), pos + match.end())
+            start, stop, name, kind = tag
+            result.append(content[pos:start])
+            pos = stop if kind == _EMPTY else _skip_tag(content, name, stop, end)
         return _unescape("".join(result).strip())
 
     def mkdir(self, path: str, parents: bool = False) -> "Loopy":
@@ -310,16 +406,10 @@ class Loopy:
         if not segments:
             return self
 
-        # Find how much of the path exists
-        existing = []
-        for i, seg in enumerate(segments):
-            test_path = "/" + "/".join(segments[: i + 1])
-            if self.exists(test_path):
-                existing.append(seg)
-            else:
-                break
-
-        to_create = segments[len(existing):]
+        # Find how much of the path exists in a single descent from the root
+        depth, node = self._descend(segments)
+        existing = segments[:depth]
+        to_create = segments[depth:]
 
         if not to_create:
             return self  # Already exists
@@ -328,10 +418,13 @@ class Loopy:
             parent_path = "/" + "/".join(segments[:-1])
             raise KeyError(f"Parent path does not exist: {parent_path}")
 
+        if node is None:
+            raise KeyError("Malformed: no root element")
+
         # Check if we're trying to create under a file (has text content)
         if existing:
             parent_path = "/" + "/".join(existing)
-            if self.isfile(parent_path):
+            if self._is_file_node(node):
                 raise NotADirectoryError(f"Cannot create directory under file: {parent_path}")
 
         # Build nested tags for new nodes (innermost first)
@@ -340,34 +433,13 @@ class Loopy:
         for seg in reversed(to_create[:-1]):
             new_nodes = f"<{seg}>{new_nodes}</{seg}>"
 
-        # Insert into parent
-        if existing:
-            parent_path = "/" + "/".join(existing)
-        else:
-            parent_path = "/"
-
-        start, end, has_content, content = self._find_node(parent_path)
-
-        if has_content:
-            # Insert before closing tag
-            parent_name = existing[-1] if existing else "root"
-            close_pos = self._data.rfind(f"</{parent_name}>", start, end)
-            self._data = self._data[:close_pos] + new_nodes + self._data[close_pos:]
-        else:
-            # Convert self-closing to open/close
-            parent_name = existing[-1] if existing else "root"
-            self._data = (
-                self._data[:start]
-                + f"<{parent_name}>{new_nodes}</{parent_name}>"
-                + self._data[end:]
-            )
-
+        self._insert_under("/" + "/".join(existing), new_nodes, node=node)
         return self
 
     def touch(self, path: str, content: str = "") -> "Loopy":
         """Create a leaf node with optional content."""
         path = self._resolve(path)
-        if self.exists(path):
+        if self._try_find_node(path) is not None:
             # Update content if exists
             if content:
                 return self.write(path, content)
@@ -380,9 +452,10 @@ class Loopy:
         # Ensure parent exists and is not a file
         if len(segments) > 1:
             parent_path = "/" + "/".join(segments[:-1])
-            if not self.exists(parent_path):
+            parent = self._try_find_node(parent_path)
+            if parent is None:
                 self.mkdir(parent_path, parents=True)
-            elif self.isfile(parent_path):
+            elif self._is_file_node(parent):
                 raise NotADirectoryError(f"Cannot create file under file: {parent_path}")
 
         name = segments[-1]
@@ -391,52 +464,25 @@ class Loopy:
         else:
             new_node = f"<{name}/>"
 
-        # Insert into parent
-        parent_path = "/" + "/".join(segments[:-1]) if len(segments) > 1 else "/"
-        start, end, has_content, _ = self._find_node(parent_path)
-
-        if has_content:
-            parent_name = segments[-2] if len(segments) > 1 else "root"
-            close_pos = self._data.rfind(f"</{parent_name}>", start, end)
-            self._data = self._data[:close_pos] + new_node + self._data[close_pos:]
-        else:
-            parent_name = segments[-2] if len(segments) > 1 else "root"
-            self._data = (
-                self._data[:start]
-                + f"<{parent_name}>{new_node}</{parent_name}>"
-                + self._data[end:]
-            )
-
+        self._insert_under("/" + "/".join(segments[:-1]), new_node)
         return self
 
     def write(self, path: str, content: str) -> "Loopy":
         """Write/overwrite content to a node. Raises IsADirectoryError for directories."""
         path = self._resolve(path)
-        if not self.exists(path):
+        node = self._try_find_node(path)
+        if node is None:
             return self.touch(path, content)
+        start, end, has_content, old_content = node
 
         # Don't allow writing content to directories
-        if self.ls(path):
+        if has_content and next(self._iter_children(old_content), None) is not None:
             raise IsADirectoryError(f"Cannot write content to directory: {path}")
 
         segments = self._normalize_path(path)
         name = segments[-1] if segments else "root"
 
-        start, end, has_content, old_content = self._find_node(path)
-
-        # Preserve children, replace text content
-        children_tags = ""
-        for child in self._extract_children(old_content):
-            child_start = old_content.find(f"<{child}")
-            if old_content[child_start:].startswith(f"<{child}/>"):
-                children_tags += f"<{child}/>"
-            else:
-                child_end = old_content.find(f"</{child}>", child_start) + len(f"</{child}>")
-                children_tags += old_content[child_start:child_end]
-
-        escaped_content = _escape(content)
-        new_inner = escaped_content + children_tags if children_tags else escaped_content
-        self._data = self._data[:start] + f"<{name}>{new_inner}</{name}>" + self._data[end:]
+        self._data = self._data[:start] + f"<{name}>{_escape(content)}</{name}>" + self._data[end:]
 
         return self
 
@@ -450,10 +496,10 @@ class Loopy:
             return self
 
         # Check if non-empty directory
-        if self.ls(path) and not recursive:
+        start, end, has_content, content = self._find_node(path)
+        if not recursive and has_content and next(self._iter_children(content), None) is not None:
             raise OSError(f"Directory not empty: {path} (use recursive=True)")
 
-        start, end, _, _ = self._find_node(path)
         self._data = self._data[:start] + self._data[end:]
         return self
 
@@ -465,25 +511,43 @@ class Loopy:
         # Ensure destination parent exists
         if len(dst_segments) > 1:
             dst_parent = "/" + "/".join(dst_segments[:-1])
-            if not self.exists(dst_parent):
+            if self._try_find_node(dst_parent) is None:
                 self.mkdir(dst_parent, parents=True)
 
         # Rename node if needed
         if src_name != new_name:
-            node_str = re.sub(rf"^<{re.escape(src_name)}(/?>)", f"<{new_name}\\1", node_str)
-            node_str = re.sub(rf"</{re.escape(src_name)}>$", f"</{new_name}>", node_str)
+            node_str = _rename_node_str(node_str, src_name, new_name)
 
-        # Insert at destination parent
-        dst_parent = "/" + "/".join(dst_segments[:-1]) if len(dst_segments) > 1 else "/"
-        start, end, has_content, _ = self._find_node(dst_parent)
-        parent_name = dst_segments[-2] if len(dst_segments) > 1 else "root"
+        self._insert_under("/" + "/".join(dst_segments[:-1]), node_str)
+
+    def _insert_under(
+        self, parent_path: str, node_str: str, node: Optional[tuple[int, int, bool, str]] = None
+    ) -> None:
+        """
+        Append a serialized node as the last child of parent_path.
+        Pass node (the parent's _find_node result) when it is already known
+        to skip looking it up again.
+        """
+        if node is None:
+            node = self._find_node(parent_path)
+        start, end, has_content, _ = node
+        segments = self._normalize_path(parent_path)
+        parent_name = segments[-1] if segments else "root"
 
         if has_content:
-            close_pos = self._data.rfind(f"</{parent_name}>", start, end)
+            # The parent's closing tag sits at the very end of its span
+            close_pos = end - len(parent_name) - 3  # len(f"</{parent_name}>")
             self._data = self._data[:close_pos] + node_str + self._data[close_pos:]
         else:
+            # Convert self-closing to open/close
             self._data = f"{self._data[:start]}<{parent_name}>{node_str}</{parent_name}>{self._data[end:]}"
 
+    def _into_dir(self, src: str, dst: str) -> str:
+        """If dst is an existing directory, return the path inside it named after src."""
+        if self.isdir(dst):
+            return f"{dst.rstrip('/')}/{self._normalize_path(src)[-1]}"
+        return dst
+
     def mv(self, src: str, dst: str) -> "Loopy":
         """Move a node to a new location. If dst is a directory, moves into it."""
         src, dst = self._resolve(src.rstrip("/")), self._resolve(dst.rstrip("/"))
@@ -493,12 +557,9 @@ class Loopy:
             return self
 
         # If destination is existing directory, move INTO it with same name
-        if self.exists(dst) and self.isdir(dst):
-            src_name = self._normalize_path(src)[-1]
-            dst = f"{dst.rstrip('/')}/{src_name}"
-            # Check again after expansion
-            if src == dst:
-                return self
+        dst = self._into_dir(src, dst)
+        if src == dst:
+            return self
 
         start, end, _, _ = self._find_node(src)
         node_str = self._data[start:end]
@@ -517,12 +578,9 @@ class Loopy:
             raise ValueError(f"Cannot copy to self: {src}")
 
         # If destination is existing directory, copy INTO it with same name
-        if self.exists(dst) and self.isdir(dst):
-            src_name = self._normalize_path(src)[-1]
-            dst = f"{dst.rstrip('/')}/{src_name}"
-            # Check again after expansion
-            if src == dst:
-                raise ValueError(f"Cannot copy to self: {src}")
+        dst = self._into_dir(src, dst)
+        if src == dst:
+            raise ValueError(f"Cannot copy to self: {src}")
 
         start, end, _, _ = self._find_node(src)
         node_str = self._data[start:end]
@@ -558,21 +616,20 @@ class Loopy:
         flags = re.IGNORECASE if ignore_case else 0
         regex = re.compile(pattern, flags)
         results = []
+        data = self._data
 
-        def _walk(current_path: str):
-            segments = self._normalize_path(current_path)
-            name = segments[-1] if segments else "root"
+        # Each entry: (name, path, content_start, content_end)
+        stack = [(self._basename(path), path, *self._content_span(path))]
+        while stack:
+            name, current_path, start, end = stack.pop()
+            node_content, children = _scan_content(data, start, end)
 
             matches = bool(regex.search(name))
 
             # Also search content if requested
             if not matches and content:
-                try:
-                    node_content = self.cat(current_path)
-                    if node_content and regex.search(node_content):
-                        matches = True
-                except KeyError:
-                    pass
+                if node_content and regex.search(node_content):
+                    matches = True
 
             # Apply invert
             if invert:
@@ -581,11 +638,10 @@ class Loopy:
             if matches:
                 results.append(current_path)
 
-            # Recurse into children
-            for child in self.ls(current_path):
-                _walk(f"{current_path.rstrip('/')}/{child}")
+            # Push children in reverse so first child is processed first
+            for child, child_start, child_end in reversed(children):
+                stack.append((child, self._child_path(current_path, child), child_start, child_end))
 
-        _walk(path)
         return len(results) if count else results
 
     def sed(
@@ -612,21 +668,38 @@ class Loopy:
             self for chaining
         """
         path = self._resolve(path)
-        flags = re.IGNORECASE if ignore_case else 0
-
-        def _apply(node_path: str):
-            content = self.cat(node_path)
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+        data = self._data
+
+        # Collect every change first, then rebuild _data in one pass.
+        # Each entry: (node_start, node_end, name, new_content)
+        updates = []
+        stack = [(self._basename(path), path, *self._content_span(path))]
+        while stack:
+            name, node_path, start, end = stack.pop()
+            content, children = _scan_content(data, start, end)
             if content:
-                new_content = re.sub(pattern, replacement, content, count=count, flags=flags)
+                new_content = regex.sub(replacement, content, count=count)
                 if new_content != content:
-                    self.write(node_path, new_content)
-
-        _apply(path)
-
-        if recursive:
-            for child in self.ls(path):
-                child_path = f"{path.rstrip('/')}/{child}"
-                self.sed(child_path, pattern, replacement, count, ignore_case, recursive=True)
+                    if children:
+                        raise IsADirectoryError(f"Cannot write content to directory: {node_path}")
+                    # Nodes with text are open/close tags: <name>...</name>
+                    updates.append((start - len(name) - 2, end + len(name) + 3, name, new_content))
+            if recursive:
+                for child, child_start, child_end in reversed(children):
+                    stack.append((child, self._child_path(node_path, child), child_start, child_end))
+
+        if updates:
+            # Updated nodes have no children, so their spans never overlap
+            updates.sort()
+            parts = []
+            pos = 0
+            for node_start, node_end, name, new_content in updates:
+                parts.append(data[pos:node_start])
+                parts.append(f"<{name}>{_escape(new_content)}</{name}>")
+                pos = node_end
+            parts.append(data[pos:])
+            self._data = "".join(parts)
 
         return self
 
@@ -634,10 +707,13 @@ class Loopy:
         """Return a tree visualization."""
         path = self._resolve(path)
         lines = []
+        data = self._data
 
-        def _walk(current_path: str, prefix: str, is_last: bool, is_root: bool):
-            segments = self._normalize_path(current_path)
-            name = segments[-1] if segments else "root"
+        # Each entry: (name, content_start, content_end, prefix, is_last, is_root).
+        # The output only shows names, so child paths are never built.
+        stack = [(self._basename(path), *self._content_span(path), "", True, True)]
+        while stack:
+            name, start, end, prefix, is_last, is_root = stack.pop()
 
             # Connector for this node
             if is_root:
@@ -645,23 +721,22 @@ class Loopy:
             else:
                 connector = "└── " if is_last else "├── "
 
-            content = self.cat(current_path)
+            content, children = _scan_content(data, start, end)
             if content:
                 lines.append(f"{prefix}{connector}{name}: {content[:50]}{'...' if len(content) > 50 else ''}")
             else:
                 lines.append(f"{prefix}{connector}{name}/")
 
-            children = self.ls(current_path)
-            for i, child in enumerate(children):
+            # Push children in reverse so first child is processed first
+            for i in range(len(children) - 1, -1, -1):
+                child, child_start, child_end = children[i]
                 child_is_last = i == len(children) - 1
-                child_path = f"{current_path.rstrip('/')}/{child}"
                 if is_root:
                     child_prefix = ""
                 else:
                     child_prefix = prefix + ("    " if is_last else "│   ")
-                _walk(child_path, child_prefix, child_is_last, False)
+                stack.append((child, child_start, child_end, child_prefix, child_is_last, False))
 
-        _walk(path, "", True, True)
         return "\n".join(lines)
 
     def find(self, path: str = ".", name: Optional[str] = None, type: Optional[str] = None) -> list[str]:
@@ -676,11 +751,13 @@ class Loopy:
         path = self._resolve(path)
         results = []
         pattern = re.compile(name, re.IGNORECASE) if name else None
+        data = self._data
 
-        def _walk(current_path: str):
-            segments = self._normalize_path(current_path)
-            node_name = segments[-1] if segments else "root"
-            children = self.ls(current_path)
+        # Each entry: (name, path, content_start, content_end)
+        stack = [(self._basename(path), path, *self._content_span(path))]
+        while stack:
+            node_name, current_path, start, end = stack.pop()
+            _, children = _scan_content(data, start, end, text=False)
             is_dir = len(children) > 0
 
             # Type filter
@@ -691,10 +768,9 @@ class Loopy:
             elif pattern is None or pattern.search(node_name):
                 results.append(current_path)
 
-            for child in children:
-                _walk(f"{current_path.rstrip('/')}/{child}")
+            for child, child_start, child_end in reversed(children):
+                stack.append((child, self._child_path(current_path, child), child_start, child_end))
 
-        _walk(path)
         return results
 
     def walk(self, path: str = ".") -> list[tuple[str, list[str], list[str]]]:
@@ -705,22 +781,25 @@ class Loopy:
         """
         path = self._resolve(path)
         results = []
+        data = self._data
 
-        def _walk(current_path: str):
-            children = self.ls(current_path)
+        stack = [(path, *self._content_span(path))]
+        while stack:
+            current_path, start, end = stack.pop()
+            _, children = _scan_content(data, start, end, text=False)
             dirs = []
             files = []
-            for child in children:
-                child_path = f"{current_path.rstrip('/')}/{child}"
-                if self.ls(child_path):  # Has children = directory
+            dir_spans = []
+            for child, child_start, child_end in children:
+                # Has children = directory (any tag inside a well-formed body opens a child)
+                if data.find("<", child_start, child_end) != -1:
                     dirs.append(child)
+                    dir_spans.append((self._child_path(current_path, child), child_start, child_end))
                 else:
                     files.append(child)
             results.append((current_path, dirs, files))
-            for d in dirs:
-                _walk(f"{current_path.rstrip('/')}/{d}")
+            stack.extend(reversed(dir_spans))
 
-        _walk(path)
         return results
 
     def glob(self, pattern: str, path: str = ".") -> list[str]:
@@ -730,25 +809,42 @@ class Loopy:
         Example: /animals/*/dog, /images/**/*.jpg
         """
         path = self._resolve(path)
-        # Convert glob to regex
-        regex_pattern = pattern
-        regex_pattern = regex_pattern.replace(".", r"\.")
-        regex_pattern = regex_pattern.replace("**", "<<<GLOBSTAR>>>")
-        regex_pattern = regex_pattern.replace("*", r"[^/]*")
-        regex_pattern = regex_pattern.replace("<<<GLOBSTAR>>>", r".*")
-        regex_pattern = regex_pattern.replace("?", r"[^/]")
-        regex_pattern = f"^{regex_pattern}$"
-
-        regex = re.compile(regex_pattern)
+        regex = glob_to_regex(pattern)
         results = []
-
-        def _walk(current_path: str):
+        data = self._data
+
+        path_segments = self._normalize_path(path, validate=False)
+
+        # Each entry: (path, content_start, content_end, depth)
+        level = [(path, *self._content_span(path), len(path_segments))]
+        max_depth: Optional[int] = None
+
+        if pattern.startswith("/"):
+            # Only paths under the pattern's literal leading segments can
+            # match, so start the walk there instead of at `path`.
+            prefix, max_depth = glob_scope(pattern)
+            common = min(len(prefix), len(path_segments))
+            if prefix[:common] != path_segments[:common]:
+                return results
+            for seg in prefix[len(path_segments) :]:
+                level = [
+                    (self._child_path(parent_path, child), child_start, child_end, depth + 1)
+                    for parent_path, start, end, depth in level
+                    for child, child_start, child_end in _scan_content(data, start, end, text=False)[1]
+                    if child == seg
+                ]
+
+        stack = level[::-1]
+        while stack:
+            current_path, start, end, depth = stack.pop()
             if regex.match(current_path):
                 results.append(current_path)
-            for child in self.ls(current_path):
-                _walk(f"{current_path.rstrip('/')}/{child}")
+            if max_depth is not None and depth >= max_depth:
+                continue
+            _, children = _scan_content(data, start, end, text=False)
+            for child, child_start, child_end in reversed(children):
+                stack.append((self._child_path(current_path, child), child_start, child_end, depth + 1))
 
-        _walk(path)
         return results
 
     def head(self, path: str, n: int = 10) -> str:
@@ -772,26 +868,29 @@ class Loopy:
             content_size: If True, return total bytes of content. If False, return node count.
         """
         path = self._resolve(path)
-        total = 0
+        data = self._data
+        start, end = self._content_span(path)
 
-        def _walk(current_path: str):
-            nonlocal total
-            if content_size:
-                total += len(self.cat(current_path))
-            else:
-                total += 1
-            for child in self.ls(current_path):
-                _walk(f"{current_path.rstrip('/')}/{child}")
+        if not content_size:
+            # Text is stored escaped, so every '<' starts a tag: the node itself
+            # plus one per open or self-closing tag in its content.
+            return 1 + data.count("<", start, end) - data.count("</", start, end)
+
+        total = 0
+        stack = [(start, end)]
+        while stack:
+            start, end = stack.pop()
+            text, children = _scan_content(data, start, end)
+            total += len(text)
+            stack.extend((child_start, child_end) for _, child_start, child_end in children)
 
-        _walk(path)
         return total
 
     def info(self, path: str) -> dict:
         """Get metadata about a node."""
         path = self._resolve(path)
-        _, _, has_content, content = self._find_node(path)
-        children = self.ls(path)
-        text_content = self.cat(path)
+        # One scan gives both the children (ls) and the text (cat)
+        text_content, children = _scan_content(self._data, *self._content_span(path))
 
         segments = self._normalize_path(path)
         name = segments[-1] if segments else "root"
@@ -808,25 +907,13 @@ class Loopy:
     def isdir(self, path: str) -> bool:
         """Check if path is a directory (open/close tag that can contain children)."""
         path = self._resolve(path)
-        try:
-            _, _, has_content, content = self._find_node(path)
-            # Directory = open/close tag with no text content (only children or empty)
-            # Check if any text exists outside of child tags
-            if not has_content:
-                return False  # Self-closing = file
-            text_only = self.cat(path)
-            return not text_only  # Directory if no text content
-        except KeyError:
-            return False
+        # Directory = open/close tag with no text content (only children or empty)
+        node = self._try_find_node(path)
+        return node is not None and not self._is_file_node(node)
 
     def isfile(self, path: str) -> bool:
         """Check if path is a file (self-closing or has text content)."""
         path = self._resolve(path)
-        try:
-            _, _, has_content, _ = self._find_node(path)
-            if not has_content:
-                return True  # Self-closing = file
-            # Has text content = file (even if it has children)
-            return bool(self.cat(path))
-        except KeyError:
-            return False
+        # Self-closing, or has text content (even if it has children)
+        node = self._try_find_node(path)
+        return node is not None and self._is_file_node(node)
@@ -1,13 +1,21 @@
 """Core Loopy implementation (node-based)."""
 
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 import re
-from typing import Callable, Optional
+import sys
+from typing import Callable, Iterable, Iterator, Mapping, Optional
+
+from ._glob import glob_scope, glob_to_regex
 
 # Regex pattern for valid tag names (alphanumeric, underscore, hyphen, dot)
 TAG_NAME = r"[\w.\-]+"
 _TAG_NAME_RE = re.compile(f"^{TAG_NAME}$")
 
+# Nodes with more children than this get a name -> child index for lookups
+_CHILD_INDEX_MIN = 8
+
 
 def _validate_segment(seg: str) -> None:
     """Raise ValueError if segment contains invalid characters."""
@@ -49,10 +57,42 @@ def _escape(text: str) -> str:
 
 def _unescape(text: str) -> str:
     """Unescape special characters when reading."""
+    if "&" not in text:
+        return text  # Common case: nothing escaped, skip the three passes
     return text.replace("&lt;", "<").replace("&gt;", ">").replace("&amp;", "&")
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _compile_search(pattern: str, ignore_case: bool) -> Callable[[str], bool]:
+    """Return a predicate telling whether pattern matches anywhere in a string.
+
+    Patterns without regex metacharacters skip the regex engine and use a
+    plain substring test (case-folded for ASCII when ignore_case is set).
+    """
+    regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+    def regex_search(text: str) -> bool:
+        return regex.search(text) is not None
+
+    if re.escape(pattern) != pattern:
+        return regex_search
+    if not ignore_case:
+        return lambda text: pattern in text
+    if not pattern.isascii():
+        return regex_search
+
+    folded = pattern.lower()
+
+    def literal_search(text: str) -> bool:
+        # str.lower() only agrees with re.IGNORECASE on ASCII text
+        if text.isascii():
+            return folded in text.lower()
+        return regex.search(text) is not None
+
+    return literal_search
+
+
+@dataclass(slots=True, eq=False)
 class Node:
     """A node in the Loopy tree.
 
@@ -64,6 +104,8 @@ class Node:
         self_closing: If True, serializes as <name/> when empty
         link_target: If set, this node is a symlink pointing to the given path.
                     Symlinks are always self-closing and have no text/children.
+        index: Lazily built name -> first child map for wide nodes. Kept in
+               sync by Loopy's _append_child/_remove_child; None if not built.
     """
 
     name: str
@@ -72,6 +114,7 @@ class Node:
     parent: Optional["Node"] = None
     self_closing: bool = False
     link_target: Optional[str] = None
+    index: Optional[dict[str, "Node"]] = field(default=None, repr=False)
 
 
 def _parse_symlink_attr(token: str) -> tuple[str, Optional[str]]:
@@ -157,7 +200,10 @@ def parse(data: str) -> Node:
                     raise ValueError(f"Invalid tag name: {name!r}")
                 parent = stack[-1] if stack else None
                 node = Node(
-                    name=name, parent=parent, self_closing=True, link_target=link_target
+                    name=sys.intern(name),
+                    parent=parent,
+                    self_closing=True,
+                    link_target=link_target,
                 )
                 if parent:
                     parent.children.append(node)
@@ -170,7 +216,9 @@ def parse(data: str) -> Node:
                 if not _TAG_NAME_RE.match(name):
                     raise ValueError(f"Invalid tag name: {name!r}")
                 parent = stack[-1] if stack else None
-                node = Node(name=name, parent=parent, self_closing=self_closing)
+                node = Node(
+                    name=sys.intern(name), parent=parent, self_closing=self_closing
+                )
                 if parent:
                     parent.children.append(node)
                 if self_closing:
@@ -230,11 +278,24 @@ class Loopy:
         self, data: str = "<root/>", on_mutate: Callable[[], None] | None = None
     ):
         raw = data if data else "<root/>"
+        self._init_state(parse(raw), raw, on_mutate)
+
+    def _init_state(
+        self,
+        root: Node,
+        raw: str,
+        on_mutate: Callable[[], None] | None,
+        dirty: bool = False,
+        cwd: str = "/",
+    ) -> None:
+        """Set up instance state. Shared by __init__ and copy()."""
+        self._root = root
         self._raw_cache = raw
-        self._root = parse(raw)
-        self._cwd = "/"
-        self._dirty = False
+        self._dirty = dirty
+        self._cwd = cwd
         self._on_mutate = on_mutate
+        self._batch_depth = 0
+        self._batch_pending = False
 
     @property
     def cwd(self) -> str:
@@ -244,7 +305,34 @@ class Loopy:
     def _mark_dirty(self) -> None:
         self._dirty = True
         if self._on_mutate is not None:
-            self._on_mutate()
+            if self._batch_depth:
+                self._batch_pending = True
+            else:
+                self._on_mutate()
+
+    @contextmanager
+    def batch(self) -> Iterator["Loopy"]:
+        """Group mutations so on_mutate fires once, on exit.
+
+        Useful for scripted builds against a FileBackedLoopy, where every
+        touch/mkdir would otherwise rewrite the whole file. Batches nest; the
+        hook runs when the outermost one exits (also on error, so whatever was
+        applied is still synced).
+
+        Example:
+            with tree.batch():
+                for i in range(1000):
+                    tree.touch(f"/logs/{i}", "...")
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_pending:
+                self._batch_pending = False
+                if self._on_mutate is not None:
+                    self._on_mutate()
 
     def _resolve(self, path: str) -> str:
         """Resolve path relative to cwd. Supports '.' and '..' components."""
@@ -285,6 +373,30 @@ class Loopy:
     def __contains__(self, path: str) -> bool:
         return self.exists(path)
 
+    def __reduce__(self):
+        # Pickle as the raw string: compact, and avoids recursing through the
+        # node graph (which fails on deep trees). on_mutate is not preserved.
+        # Subclasses are rebuilt as type(self)(raw); ones whose __init__ takes
+        # other arguments must override this (see FileBackedLoopy).
+        return (type(self), (self.raw,), {"_cwd": self._cwd})
+
+    def copy(self) -> "Loopy":
+        """Return an independent copy of this tree (without on_mutate).
+
+        Clones the node graph directly instead of re-parsing the raw string.
+        The copy is always a plain Loopy, even for subclasses: a copy of a
+        FileBackedLoopy is an in-memory tree that does not write to the file.
+        """
+        other = Loopy.__new__(Loopy)
+        other._init_state(
+            self._clone_node(self._root),
+            self._raw_cache,
+            None,
+            dirty=self._dirty,
+            cwd=self._cwd,
+        )
+        return other
+
     # --- Core Path Utilities ---
 
     def _normalize_path(self, path: str, validate: bool = True) -> list[str]:
@@ -300,10 +412,28 @@ class Loopy:
         return segments
 
     def _get_child(self, node: Node, name: str) -> Optional[Node]:
-        for child in node.children:
-            if child.name == name:
-                return child
-        return None
+        children = node.children
+        if len(children) <= _CHILD_INDEX_MIN:
+            for child in children:
+                if child.name == name:
+                    return child
+            return None
+        index = node.index
+        if index is None:
+            index = {}
+            for child in children:
+                index.setdefault(child.name, child)
+            node.index = index
+        return index.get(name)
+
+    def _append_child(self, parent: Node, child: Node) -> None:
+        parent.children.append(child)
+        if parent.index is not None:
+            parent.index.setdefault(child.name, child)
+
+    def _remove_child(self, parent: Node, child: Node) -> None:
+        parent.children.remove(child)
+        parent.index = None
 
     def _get_node_by_segments(self, segments: list[str]) -> Node:
         node = self._root
@@ -359,6 +489,18 @@ class Loopy:
             return True
         return bool(self._cat_node(node))
 
+    def _write_node(self, node: Node, path: str, content: str) -> None:
+        """Replace a resolved node's text (without firing on_mutate)."""
+        if node.children:
+            raise IsADirectoryError(f"Cannot write content to directory: {path}")
+
+        # Don't write to a symlink node itself
+        if node.link_target is not None:
+            raise ValueError(f"Cannot write to symlink without following: {path}")
+
+        node.text = content
+        node.self_closing = False
+
     def _child_path(self, parent_path: str, child_name: str) -> str:
         if parent_path == "/":
             return f"/{child_name}"
@@ -469,8 +611,8 @@ class Loopy:
 
         while index < len(segments):
             seg = segments[index]
-            new_node = Node(name=seg, parent=node, self_closing=False)
-            node.children.append(new_node)
+            new_node = Node(name=sys.intern(seg), parent=node, self_closing=False)
+            self._append_child(node, new_node)
             node.self_closing = False
             node = new_node
             index += 1
@@ -505,16 +647,93 @@ class Loopy:
         parent_node = self._get_node(parent_path)
         name = segments[-1]
         new_node = Node(
-            name=name,
+            name=sys.intern(name),
             parent=parent_node,
             text=content if content else "",
             self_closing=not bool(content),
         )
-        parent_node.children.append(new_node)
+        self._append_child(parent_node, new_node)
         parent_node.self_closing = False
         self._mark_dirty()
         return self
 
+    def load_entries(
+        self,
+        entries: Iterable[tuple[str, Optional[str]]] | Mapping[str, Optional[str]],
+    ) -> "Loopy":
+        """Create many nodes in one pass.
+
+        Args:
+            entries: (path, content) pairs, or a dict mapping path to content.
+                     content=None creates a directory (like mkdir -p), a
+                     string creates a file (like touch).
+
+        Missing parent directories are created implicitly. The nodes along the
+        previous entry's path are reused, so grouping entries by directory
+        avoids walking from the root for every path. Insertion order is kept.
+
+        Returns:
+            self for chaining
+        """
+        if isinstance(entries, Mapping):
+            entries = entries.items()
+
+        prev: list[str] = []
+        chain: list[Node] = [self._root]
+        changed = False
+
+        try:
+            for path, content in entries:
+                path = self._resolve(path)
+                segments = self._normalize_path(path)
+
+                common = 0
+                limit = min(len(prev), len(segments))
+                while common < limit and prev[common] == segments[common]:
+                    common += 1
+                if segments and common == len(segments):
+                    # Same path as before, or an ancestor of it: revisit the leaf
+                    common -= 1
+                del chain[common + 1 :]
+                prev = segments
+
+                for index in range(common, len(segments)):
+                    node = chain[-1]
+                    seg = segments[index]
+                    child = self._get_child(node, seg)
+                    if child is None:
+                        is_leaf = index == len(segments) - 1 and content is not None
+                        if index > 0 and self._is_file_node(node):
+                            parent_path = "/" + "/".join(segments[:index])
+                            kind = "file" if is_leaf else "directory"
+                            raise NotADirectoryError(
+                                f"Cannot create {kind} under file: {parent_path}"
+                            )
+                        child = Node(
+                            name=sys.intern(seg),
+                            parent=node,
+                            text=content if is_leaf and content else "",
+                            self_closing=is_leaf and not content,
+                        )
+                        self._append_child(node, child)
+                        node.self_closing = False
+                        changed = True
+                    elif index == len(segments) - 1 and content:
+                        target = child
+                        if child.link_target is not None:
+                            target = self._resolve_through_links(path)
+                        self._write_node(target, path, content)
+                        changed = True
+                    chain.append(child)
+
+                if not segments and content:
+                    self._write_node(self._root, path, content)
+                    changed = True
+        finally:
+            if changed:
+                self._mark_dirty()
+        return self
+
     def ln(self, source: str, dest: str) -> "Loopy":
         """Create a symbolic link at dest pointing to source.
 
@@ -564,12 +783,12 @@ class Loopy:
 
         # Create the symlink node
         new_node = Node(
-            name=name,
+            name=sys.intern(name),
             parent=parent_node,
             self_closing=True,
             link_target=source,
         )
-        parent_node.children.append(new_node)
+        self._append_child(parent_node, new_node)
         parent_node.self_closing = False
         self._mark_dirty()
         return self
@@ -595,15 +814,7 @@ class Loopy:
         except KeyError:
             return self.touch(path, content)
 
-        if node.children:
-            raise IsADirectoryError(f"Cannot write content to directory: {path}")
-
-        # Don't write to a symlink node itself
-        if node.link_target is not None:
-            raise ValueError(f"Cannot write to symlink without following: {path}")
-
-        node.text = content
-        node.self_closing = False
+        self._write_node(node, path, content)
         self._mark_dirty()
         return self
 
@@ -625,37 +836,44 @@ class Loopy:
         parent = self._get_node_by_segments(parent_segments)
         target_name = segments[-1]
 
-        target = None
-        for child in parent.children:
-            if child.name == target_name:
-                target = child
-                break
+        target = self._get_child(parent, target_name)
         if target is None:
             raise KeyError(path)
 
         if target.children and not recursive:
             raise OSError(f"Directory not empty: {path} (use recursive=True)")
 
-        parent.children.remove(target)
+        self._remove_child(parent, target)
         self._mark_dirty()
         return self
 
     def _clone_node(self, node: Node, parent: Optional[Node] = None) -> Node:
-        """Clone a node and all its children.
+        """Clone a node and all its children (iterative).
 
         Symlinks are cloned as symlinks (pointing to the same target).
         """
-        clone = Node(
+        root = Node(
             name=node.name,
             parent=parent,
             text=node.text,
             self_closing=node.self_closing,
             link_target=node.link_target,  # Preserve symlink target
         )
-        for child in node.children:
-            clone_child = self._clone_node(child, parent=clone)
-            clone.children.append(clone_child)
-        return clone
+        stack = [(node, root)]
+        while stack:
+            src, dst = stack.pop()
+            for child in src.children:
+                clone = Node(
+                    name=child.name,
+                    parent=dst,
+                    text=child.text,
+                    self_closing=child.self_closing,
+                    link_target=child.link_target,
+                )
+                dst.children.append(clone)
+                if child.children:
+                    stack.append((child, clone))
+        return root
 
     def _insert_node(self, node: Node, src_name: str, dst: str) -> None:
         dst_segments = self._normalize_path(dst)
@@ -670,10 +888,10 @@ class Loopy:
         parent_node = self._get_node(dst_parent)
 
         if src_name != new_name:
-            node.name = new_name
+            node.name = sys.intern(new_name)
 
         node.parent = parent_node
-        parent_node.children.append(node)
+        self._append_child(parent_node, node)
         parent_node.self_closing = False
 
     def mv(self, src: str, dst: str) -> "Loopy":
@@ -700,7 +918,7 @@ class Loopy:
         src_name = node.name
 
         if src_parent is not None:
-            src_parent.children.remove(node)
+            self._remove_child(src_parent, node)
 
         self._insert_node(node, src_name, dst)
         self._mark_dirty()
@@ -757,8 +975,7 @@ class Loopy:
             or count if count=True
         """
         path = self._resolve(path)
-        flags = re.IGNORECASE if ignore_case else 0
-        regex = re.compile(pattern, flags)
+        search = _compile_search(pattern, ignore_case)
         results: list[str] = []
 
         start_node = self._get_node(path)
@@ -770,7 +987,7 @@ class Loopy:
                 node_content = self._cat_node(node)
                 if node_content:
                     for lineno, line in enumerate(node_content.splitlines(), 1):
-                        matched = bool(regex.search(line))
+                        matched = search(line)
                         if invert:
                             matched = not matched
                         if matched:
@@ -779,15 +996,34 @@ class Loopy:
                     stack.append((child, self._child_path(current_path, child.name)))
             return results
 
+        if not content:
+            # Name-only search: match node.name directly, and only build a
+            # node's path when it is reported or has children to descend into.
+            root = self._root
+            stack = [(start_node, path, True)]
+            while stack:
+                node, node_path, resolved = stack.pop()
+                matches = search("root" if node is root else node.name)
+                if invert:
+                    matches = not matches
+                children = node.children
+                if matches or children:
+                    if not resolved:
+                        node_path = self._child_path(node_path, node.name)
+                    if matches:
+                        results.append(node_path)
+                    for child in reversed(children):
+                        stack.append((child, node_path, False))
+            return len(results) if count else results
+
         stack = [(start_node, path)]
         while stack:
             node, current_path = stack.pop()
-            name = "root" if current_path == "/" else current_path.split("/")[-1]
-            matches = bool(regex.search(name))
+            matches = search("root" if current_path == "/" else node.name)
 
             if not matches and content:
                 node_content = self._cat_node(node)
-                if node_content and regex.search(node_content):
+                if node_content and search(node_content):
                     matches = True
 
             if invert:
@@ -825,28 +1061,44 @@ class Loopy:
             self for chaining
         """
         path = self._resolve(path)
-        flags = re.IGNORECASE if ignore_case else 0
+        regex = re.compile(pattern, re.IGNORECASE if ignore_case else 0)
 
-        def _apply(node_path: str) -> None:
-            content = self.cat(node_path)
+        # Collect every change before applying any, so an error leaves the
+        # tree untouched. Links are followed, but each target is edited once.
+        updates: list[tuple[Node, str]] = []
+        seen: set[int] = set()
+        stack = [(self._resolve_through_links(path), path)]
+        while stack:
+            node, node_path = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+
+            content = self._cat_node(node)
             if content:
-                new_content = re.sub(
-                    pattern, replacement, content, count=count, flags=flags
-                )
+                new_content = regex.sub(replacement, content, count=count)
                 if new_content != content:
-                    self.write(node_path, new_content)
-
-        _apply(path)
-
-        if recursive:
-            stack = [path]
-            while stack:
-                current = stack.pop()
-                for child in self.ls(current):
-                    child_path = f"{current.rstrip('/')}/{child}"
-                    _apply(child_path)
-                    stack.append(child_path)
+                    if node.children:
+                        raise IsADirectoryError(
+                            f"Cannot write content to directory: {node_path}"
+                        )
+                    updates.append((node, new_content))
 
+            if recursive:
+                for child in reversed(node.children):
+                    child_path = self._child_path(node_path, child.name)
+                    if child.link_target is not None:
+                        try:
+                            child = self._resolve_through_links(child_path)
+                        except (KeyError, ValueError):
+                            continue  # Dangling link or link cycle
+                    stack.append((child, child_path))
+
+        for node, new_content in updates:
+            node.text = new_content
+            node.self_closing = False
+        if updates:
+            self._mark_dirty()
         return self
 
     def tree(self, path: str = ".") -> str:
@@ -858,14 +1110,14 @@ class Loopy:
         node = self._get_node(path)
         lines: list[str] = []
 
-        # Iterative tree walk using stack
-        # Each entry: (node, path, prefix, is_last, is_root)
-        stack: list[tuple[Node, str, str, bool, bool]] = [
-            (node, path, "", True, True)
-        ]
+        # Iterative tree walk using stack. The output only shows names, so
+        # child paths are never built.
+        # Each entry: (node, prefix, is_last, is_root)
+        root = self._root
+        stack: list[tuple[Node, str, bool, bool]] = [(node, "", True, True)]
         while stack:
-            current_node, current_path, prefix, is_last, is_root = stack.pop()
-            name = "root" if current_path == "/" else current_node.name
+            current_node, prefix, is_last, is_root = stack.pop()
+            name = "root" if current_node is root else current_node.name
 
             if is_root:
                 connector = ""
@@ -887,11 +1139,10 @@ class Loopy:
             for i in range(len(children) - 1, -1, -1):
                 child = children[i]
                 child_is_last = i == len(children) - 1
-                child_path = self._child_path(current_path, child.name)
                 child_prefix = (
                     "" if is_root else prefix + ("    " if is_last else "│   ")
                 )
-                stack.append((child, child_path, child_prefix, child_is_last, False))
+                stack.append((child, child_prefix, child_is_last, False))
         return "\n".join(lines)
 
     def find(
@@ -971,26 +1222,40 @@ class Loopy:
         Example: /animals/*/dog, /images/**/*.jpg
         """
         path = self._resolve(path)
-        regex_pattern = pattern
-        regex_pattern = regex_pattern.replace(".", r"\.")
-        regex_pattern = regex_pattern.replace("**", "<<<GLOBSTAR>>>")
-        regex_pattern = regex_pattern.replace("*", r"[^/]*")
-        regex_pattern = regex_pattern.replace("<<<GLOBSTAR>>>", r".*")
-        regex_pattern = regex_pattern.replace("?", r"[^/]")
-        regex_pattern = f"^{regex_pattern}$"
-
-        regex = re.compile(regex_pattern)
+        regex = glob_to_regex(pattern)
         results: list[str] = []
 
         start = self._get_node(path)
-
-        stack = [(start, path)]
+        path_segments = self._normalize_path(path, validate=False)
+
+        # Each entry: (node, path, depth)
+        level = [(start, path, len(path_segments))]
+        max_depth: Optional[int] = None
+
+        if pattern.startswith("/"):
+            # Only paths under the pattern's literal leading segments can
+            # match, so start the walk there instead of at `path`.
+            prefix, max_depth = glob_scope(pattern)
+            common = min(len(prefix), len(path_segments))
+            if prefix[:common] != path_segments[:common]:
+                return results
+            for seg in prefix[len(path_segments) :]:
+                level = [
+                    (child, self._child_path(parent_path, child.name), depth + 1)
+                    for node, parent_path, depth in level
+                    for child in node.children
+                    if child.name == seg
+                ]
+
+        stack = level[::-1]
         while stack:
-            node, current_path = stack.pop()
+            node, current_path, depth = stack.pop()
             if regex.match(current_path):
                 results.append(current_path)
+            if max_depth is not None and depth >= max_depth:
+                continue
             for child in reversed(node.children):
-                stack.append((child, self._child_path(current_path, child.name)))
+                stack.append((child, self._child_path(current_path, child.name), depth + 1))
         return results
 
     def head(self, path: str, n: int = 10) -> str:
@@ -22,6 +22,14 @@ class FileBackedLoopy(Loopy):
         data = self._path.read_text() if self._path.exists() else ""
         super().__init__(data, on_mutate=self.sync)
 
+    def __reduce__(self):
+        # Outside a batch every mutation is already synced; inside one, flush
+        # the pending edits so reopening the file restores them.
+        if self._batch_pending:
+            self._batch_pending = False
+            self.sync()
+        return (type(self), (self._path,), {"_cwd": self._cwd})
+
     @property
     def path(self) -> Path:
         return self._path
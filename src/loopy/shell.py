@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 import shlex
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
@@ -140,6 +141,12 @@ def _split_pipeline(command: str) -> list[str]:
     return segments
 
 
+@lru_cache(maxsize=512)
+def _split_segment(segment: str) -> tuple[str, ...]:
+    """shlex.split, memoized: scripts and agent loops repeat the same commands."""
+    return tuple(shlex.split(segment, posix=True))
+
+
 def _parse_pipeline(command: str) -> list[list[str]]:
     segments = _split_pipeline(command)
     if not segments:
@@ -147,10 +154,10 @@ def _parse_pipeline(command: str) -> list[list[str]]:
 
     parsed: list[list[str]] = []
     for segment in segments:
-        tokens = shlex.split(segment, posix=True)
+        tokens = _split_segment(segment)
         if not tokens:
             raise ValueError("empty command in pipeline")
-        parsed.append(tokens)
+        parsed.append(list(tokens))
     return parsed
 
 
@@ -284,31 +291,26 @@ def _ls_recursive(tree: Loopy, path: str, classify: bool) -> str:
         return _display_path(path)
 
     lines: list[str] = []
-
-    def _walk(current: str) -> None:
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        if lines:
+            lines.append("")
         lines.append(f"{_display_path(current)}:")
 
-        children = tree.ls(current, classify=False)
-        if classify:
-            entries = []
-            for child in children:
-                child_path = f"{current.rstrip('/')}/{child}"
-                if tree.isdir(child_path):
-                    entries.append(f"{child}/")
-                else:
-                    entries.append(child)
-        else:
-            entries = children
-
-        lines.extend(entries)
-
-        for child in children:
+        # One isdir per child, shared by the -F suffixes and the descent
+        subdirs: list[str] = []
+        for child in tree.ls(current, classify=False):
             child_path = f"{current.rstrip('/')}/{child}"
             if tree.isdir(child_path):
-                lines.append("")
-                _walk(child_path)
+                subdirs.append(child_path)
+                lines.append(f"{child}/" if classify else child)
+            else:
+                lines.append(child)
+
+        # Push in reverse so the first subdirectory is listed first
+        stack.extend(reversed(subdirs))
 
-    _walk(path)
     return "\n".join(lines)
 
 
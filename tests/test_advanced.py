@@ -1,5 +1,9 @@
 """Advanced tests to challenge Loopy's grep, sed, find, glob, and edge cases."""
 
+import pickle
+
+import pytest
+
 from loopy import Loopy
 
 
@@ -37,6 +41,15 @@ class TestGrep:
         results = self.tree.grep("error", ignore_case=False)
         assert "/logs/errors" in results
 
+    def test_grep_literal_pattern_case_folding(self):
+        tree = Loopy()
+        tree.touch("/a", "Hello World")
+        tree.touch("/b", "ſtraße")  # long s folds to "s" under re.IGNORECASE
+        assert tree.grep("hello", content=True) == ["/a"]
+        assert tree.grep("hello", content=True, ignore_case=False) == []
+        assert tree.grep("S", "/b", content=True) == ["/b"]
+        assert tree.grep("S", "/b", content=True, ignore_case=False) == []
+
     def test_grep_invert(self):
         """Find paths NOT matching pattern."""
         results = self.tree.grep("error", invert=True)
@@ -153,6 +166,40 @@ class TestSed:
         assert tree.cat("/docs/b") == "FOO baz"
         assert tree.cat("/docs/sub/c") == "FOO qux"
 
+    def test_sed_recursive_through_links(self):
+        """Linked nodes are edited once; dangling links and cycles are skipped."""
+        tree = Loopy()
+        tree.touch("/docs/a", "x")
+        tree.ln("/docs/a", "/docs/alias")
+        tree.ln("/docs", "/docs/self")
+        tree.ln("/missing", "/docs/dangling")
+
+        tree.sed("/docs", "x", "xx", recursive=True)
+
+        assert tree.cat("/docs/a") == "xx"
+
+    def test_sed_recursive_dangling_link(self):
+        """A dangling link is skipped and the rest of the tree is still edited."""
+        tree = Loopy()
+        tree.touch("/docs/a", "x")
+        tree.ln("/missing", "/docs/dangling")
+
+        tree.sed("/docs", "x", "y", recursive=True)
+
+        assert tree.cat("/docs/a") == "y"
+        assert tree.readlink("/docs/dangling") == "/missing"
+        assert Loopy(tree.raw).ls("/docs") == ["a", "dangling"]
+
+    def test_sed_recursive_link_cycle(self):
+        """Links that point at each other are skipped instead of raising."""
+        tree = Loopy('<root><a><b @="/b/a"/><f>x</f></a><b><a @="/a/b"/></b></root>')
+
+        tree.sed("/", "x", "y", recursive=True)
+
+        assert tree.cat("/a/f") == "y"
+        assert Loopy(tree.raw).ls("/b") == ["a"]
+        assert tree.readlink("/b/a") == "/a/b"
+
     def test_sed_backreference(self):
         """Use capture groups in replacement."""
         tree = Loopy()
@@ -207,6 +254,34 @@ class TestGlob:
         assert "/images/cats/persian.jpg" in results
         assert "/images/dogs/labrador.jpg" in results
 
+    def test_glob_literal_and_scoped(self):
+        """Literal prefixes scope the walk without changing results."""
+        assert self.tree.glob("/images/cats/persian.jpg") == ["/images/cats/persian.jpg"]
+        assert self.tree.glob("/images/cats/missing.jpg") == []
+        assert self.tree.glob("/images/*/poodle.png", "/images/dogs") == [
+            "/images/dogs/poodle.png"
+        ]
+        assert self.tree.glob("/images/cats/*", "/docs") == []
+        assert self.tree.glob("/docs/(readme|notes).txt") == ["/docs/readme.txt"]
+
+    def test_glob_top_level_alternation(self):
+        """A raw-regex | splits the whole pattern, so no prefix is shared."""
+        assert self.tree.glob("/images/cats/persian.jpg|/docs/readme.txt") == [
+            "/images/cats/persian.jpg",
+            "/docs/readme.txt",
+        ]
+        assert self.tree.glob("/docs/*|/images/dogs/poodle.png") == [
+            "/images/dogs/poodle.png",
+            "/docs/readme.txt",
+        ]
+        # Branches are only anchored on their outer side, as in re.match
+        assert self.tree.glob("/docs|/images/cats/*") == [
+            "/images/cats/persian.jpg",
+            "/images/cats/siamese.jpg",
+            "/docs",
+            "/docs/readme.txt",
+        ]
+
 
 class TestFind:
     """Test find with type filters."""
@@ -650,3 +725,176 @@ class TestSlugify:
         # Unicode alphanumerics are preserved (\w includes them)
         result = slugify("café")
         assert result == "café"
+
+
+class TestLoadEntries:
+    """Test bulk node creation."""
+
+    def test_creates_files_and_dirs(self):
+        tree = Loopy().load_entries(
+            [
+                ("/animals/dogs/lab", "friendly"),
+                ("/animals/dogs/beagle", "curious"),
+                ("/animals/cats", None),
+                ("/empty", ""),
+            ]
+        )
+        assert tree.ls("/animals") == ["dogs", "cats"]
+        assert tree.ls("/animals/dogs") == ["lab", "beagle"]
+        assert tree.cat("/animals/dogs/beagle") == "curious"
+        assert tree.isdir("/animals/cats")
+        assert tree.isfile("/empty")
+
+    def test_matches_mkdir_touch(self):
+        entries = [
+            ("/a/b/c", "one"),
+            ("/a/d", None),
+            ("/a/b/e", "two"),
+            ("/f", ""),
+        ]
+        expected = Loopy()
+        for path, content in entries:
+            if content is None:
+                expected.mkdir(path, parents=True)
+            else:
+                expected.touch(path, content)
+        assert Loopy().load_entries(entries).raw == expected.raw
+
+    def test_accepts_mapping(self):
+        tree = Loopy().load_entries({"/docs/readme": "hello", "/docs/empty": None})
+        assert tree.ls("/docs") == ["readme", "empty"]
+        assert tree.cat("/docs/readme") == "hello"
+        assert tree.isdir("/docs/empty")
+
+    def test_existing_paths(self):
+        tree = Loopy()
+        tree.touch("/notes/todo", "old")
+        tree.load_entries([("/notes", None), ("/notes/todo", "new")])
+        assert tree.ls("/notes") == ["todo"]
+        assert tree.cat("/notes/todo") == "new"
+
+    def test_relative_to_cwd(self):
+        tree = Loopy().mkdir("/work").cd("/work")
+        tree.load_entries([("src/main", "code")])
+        assert tree.cat("/work/src/main") == "code"
+
+    def test_under_file_raises(self):
+        tree = Loopy()
+        with pytest.raises(NotADirectoryError):
+            tree.load_entries([("/f", "text"), ("/f/child", "x")])
+        assert tree.cat("/f") == "text"
+
+    def test_single_mutation_event(self):
+        calls = []
+        tree = Loopy(on_mutate=lambda: calls.append(1))
+        tree.load_entries([(f"/d/item{i}", str(i)) for i in range(10)])
+        assert len(calls) == 1
+        assert len(tree.ls("/d")) == 10
+
+    def test_overwrites_existing_files_with_single_event(self):
+        calls = []
+        tree = Loopy(on_mutate=lambda: calls.append(1))
+        tree.touch("/notes/a", "old").touch("/notes/b", "old")
+        calls.clear()
+        tree.load_entries([("/notes/a", "new"), ("/notes/b", "new")])
+        assert tree.cat("/notes/a") == "new"
+        assert tree.cat("/notes/b") == "new"
+        assert len(calls) == 1
+
+    def test_repeated_path(self):
+        tree = Loopy().load_entries([("/notes/todo", "old"), ("/notes/todo", "new")])
+        assert tree.ls("/notes") == ["todo"]
+        assert tree.cat("/notes/todo") == "new"
+
+    def test_ancestor_after_descendant(self):
+        tree = Loopy().load_entries([("/a/b", "x"), ("/a", None)])
+        assert tree.isdir("/a")
+        assert tree.cat("/a/b") == "x"
+
+        with pytest.raises(IsADirectoryError):
+            Loopy().load_entries([("/a/b", None), ("/a", "text")])
+
+
+class TaggedLoopy(Loopy):
+    pass
+
+
+class TestPickle:
+    """Test pickling via the raw string."""
+
+    def test_round_trip(self):
+        tree = Loopy().mkdir("/a/b", parents=True).touch("/a/b/c", "deep").cd("/a")
+        restored = pickle.loads(pickle.dumps(tree))
+        assert restored.raw == tree.raw
+        assert restored.cwd == "/a"
+
+    def test_deep_tree(self):
+        deep = Loopy().mkdir("/" + "/".join(f"d{i}" for i in range(2000)), parents=True)
+        assert pickle.loads(pickle.dumps(deep)).raw == deep.raw
+
+    def test_keeps_subclass(self):
+        tree = TaggedLoopy().touch("/a", "text")
+        restored = pickle.loads(pickle.dumps(tree))
+        assert type(restored) is TaggedLoopy
+        assert restored.raw == tree.raw
+
+
+class TestCopy:
+    """Test independent tree copies."""
+
+    def test_copy_is_independent(self):
+        tree = Loopy("<root><a><b>text</b><l @=\"/a/b\"/></a></root>").cd("/a")
+        copy = tree.copy()
+        assert copy.raw == tree.raw
+        assert copy.cwd == "/a"
+        copy.write("/a/b", "changed").mkdir("/c")
+        assert tree.cat("/a/b") == "text"
+        assert not tree.exists("/c")
+        assert copy.readlink("/a/l") == "/a/b"
+
+    def test_copy_drops_on_mutate(self):
+        events = []
+        tree = Loopy("<root/>", on_mutate=lambda: events.append(1))
+        tree.copy().mkdir("/x")
+        assert events == []
+
+    def test_copy_deep_tree(self):
+        tree = Loopy()
+        tree.mkdir("/" + "/".join(["d"] * 2000), parents=True)
+        assert tree.copy().raw == tree.raw
+
+    def test_copy_of_subclass_is_plain_loopy(self):
+        tree = TaggedLoopy().touch("/a", "text").cd("/")
+        copy = tree.copy()
+        assert type(copy) is Loopy
+        assert copy.raw == tree.raw
+        with copy.batch():
+            copy.touch("/b", "more")
+        assert copy.cat("/b") == "more"
+
+
+class TestWideDirectories:
+    """Test child lookups in directories with many entries."""
+
+    def test_lookup_after_mutations(self):
+        tree = Loopy()
+        for i in range(50):
+            tree.touch(f"/d/f{i}", str(i))
+        assert tree.cat("/d/f42") == "42"
+        tree.rm("/d/f42")
+        assert not tree.exists("/d/f42")
+        tree.mv("/d/f7", "/d/renamed")
+        assert tree.cat("/d/renamed") == "7"
+        assert not tree.exists("/d/f7")
+        tree.cp("/d/f3", "/d/f42")
+        assert tree.cat("/d/f42") == "3"
+        tree.mv("/d/f1", "/e")
+        assert tree.ls("/d")[:2] == ["f0", "f2"]
+        assert tree.cat("/e") == "1"
+
+    def test_duplicate_names_resolve_to_first(self):
+        kids = "".join(f"<n{i}/>" for i in range(20))
+        tree = Loopy(f"<root><d>{kids}<dup>first</dup><dup>second</dup></d></root>")
+        assert tree.cat("/d/dup") == "first"
+        tree.rm("/d/dup")
+        assert tree.cat("/d/dup") == "second"
@@ -0,0 +1,376 @@
+"""Tests for the legacy string-backed engine in loopy.core."""
+
+import pytest
+
+from loopy import core
+from loopy._glob import glob_scope
+from loopy.core import Loopy
+from loopy.core_v2 import Loopy as NodeLoopy
+
+
+def build(engine, steps):
+    tree = engine()
+    for method, args, kwargs in steps:
+        getattr(tree, method)(*args, **kwargs)
+    return tree
+
+
+SCENARIOS = {
+    "files_and_dirs": [
+        ("mkdir", ("/animals/mammals",), {"parents": True}),
+        ("touch", ("/animals/mammals/dog", "golden retriever"), {}),
+        ("touch", ("/animals/mammals/cat", "tabby"), {}),
+        ("touch", ("/animals/birds/owl",), {}),
+        ("mkdir", ("/plants",), {}),
+        ("touch", ("/notes.txt", "a < b & c > d"), {}),
+    ],
+    "edits_and_moves": [
+        ("touch", ("/a/b/c", "one"), {}),
+        ("touch", ("/a/b/d", "two"), {}),
+        ("mkdir", ("/x/y",), {"parents": True}),
+        ("write", ("/a/b/c", "uno"), {}),
+        ("cp", ("/a/b", "/x/y"), {}),
+        ("mv", ("/a/b/d", "/x/renamed"), {}),
+        ("rm", ("/a/b/c",), {}),
+        ("touch", ("/x/y/b/c", "deep"), {}),
+    ],
+    "nested_root_names": [
+        ("touch", ("/root/root/leaf", "inner"), {}),
+        ("mkdir", ("/root/other",), {}),
+        ("touch", ("/top", "text"), {}),
+    ],
+}
+
+QUERIES = [
+    ("ls", {}),
+    ("ls", {"classify": True}),
+    ("cat", {}),
+    ("isdir", {}),
+    ("isfile", {}),
+    ("tree", {}),
+    ("walk", {}),
+    ("find", {}),
+    ("du", {}),
+    ("du", {"content_size": True}),
+]
+
+
+def query(tree, method, path, kwargs):
+    try:
+        return getattr(tree, method)(path, **kwargs)
+    except Exception as e:
+        return type(e)
+
+
+class TestAgreesWithNodeEngine:
+    """The string engine should behave like core_v2 for shared operations."""
+
+    @pytest.mark.parametrize("name", sorted(SCENARIOS))
+    def test_same_raw_and_queries(self, name):
+        legacy = build(Loopy, SCENARIOS[name])
+        node = build(NodeLoopy, SCENARIOS[name])
+        assert legacy.raw == node.raw
+
+        paths = ["/"] + node.find("/")[1:] + ["/missing"]
+        for path in paths:
+            for method, kwargs in QUERIES:
+                assert query(legacy, method, path, kwargs) == query(node, method, path, kwargs), (
+                    method,
+                    path,
+                    kwargs,
+                )
+        for pattern, kwargs in [("a", {}), ("an", {"content": True}), ("O", {"ignore_case": False})]:
+            assert legacy.grep(pattern, "/", **kwargs) == node.grep(pattern, "/", **kwargs)
+
+
+class TestScanner:
+    """Test the str.find based tag scanning."""
+
+    def test_nested_node_named_root(self):
+        tree = Loopy("<root><root><a>x</a></root><b/></root>")
+        assert tree.ls("/") == ["root", "b"]
+        assert tree.ls("/root") == ["a"]
+        assert tree.cat("/root/a") == "x"
+        assert tree.find("/") == ["/", "/root", "/root/a", "/b"]
+
+    def test_same_name_nesting(self):
+        tree = Loopy("<root><d><d><d>deep</d></d><e/></d></root>")
+        assert tree.ls("/d") == ["d", "e"]
+        assert tree.cat("/d/d/d") == "deep"
+        assert tree.exists("/d/e")
+        assert not tree.exists("/d/d/e")
+
+    def test_text_between_children(self):
+        tree = Loopy("<root><n>before<c>child</c>after</n></root>")
+        assert tree.cat("/n") == "beforeafter"
+        assert tree.ls("/n") == ["c"]
+        assert tree.isfile("/n")
+
+    def test_walkers_descend_into_duplicate_siblings(self):
+        tree = Loopy("<root><a><x/></a><a><y>t</y></a></root>")
+        assert tree.find("/") == ["/", "/a", "/a/x", "/a", "/a/y"]
+        assert tree.walk("/") == [
+            ("/", ["a", "a"], []),
+            ("/a", [], ["x"]),
+            ("/a", [], ["y"]),
+        ]
+        assert tree.grep("y") == ["/a/y"]
+        assert tree.du("/") == 5
+
+    def test_missing_and_malformed_errors(self):
+        with pytest.raises(KeyError, match="/nope"):
+            Loopy().cat("/nope")
+        with pytest.raises(KeyError, match="Malformed"):
+            Loopy("<root><a></root>").cat("/a")
+
+
+class TestFindCache:
+    """Test memoized path lookups."""
+
+    def test_cached_miss_invalidated_by_mutation(self):
+        tree = Loopy()
+        assert not tree.exists("/n")
+        tree.touch("/n", "x")
+        assert tree.exists("/n")
+        tree.rm("/n")
+        assert not tree.exists("/n")
+
+    def test_cached_hit_sees_new_content(self):
+        tree = Loopy().touch("/a", "old")
+        assert tree.cat("/a") == "old"
+        tree.write("/a", "new")
+        assert tree.cat("/a") == "new"
+
+    def test_caches_offsets_not_content(self):
+        tree = Loopy().mkdir("/a/b", parents=True).touch("/a/b/c", "<x> & y")
+        first = [tree._find_node(p) for p in ("/", "/a", "/a/b", "/a/b/c")]
+        assert all(len(entry) == 3 for entry in tree._find_cache.values())
+        assert [tree._find_node(p) for p in ("/", "/a", "/a/b", "/a/b/c")] == first
+        assert tree.cat("/a/b/c") == "<x> & y"
+
+    def test_more_paths_than_cache_size(self):
+        tree = Loopy()
+        n = core._FIND_CACHE_SIZE + 10
+        for i in range(n):
+            tree.touch(f"/f{i}", str(i))
+        assert all(tree.cat(f"/f{i}") == str(i) for i in range(n))
+        assert not tree.exists(f"/f{n}")
+
+
+class TestMkdir:
+    """Test mkdir's single descent."""
+
+    def test_creates_only_missing_segments(self):
+        tree = Loopy().mkdir("/a/b", parents=True).touch("/a/b/f", "x")
+        tree.mkdir("/a/b/c/d", parents=True)
+        assert tree.ls("/a/b") == ["f", "c"]
+        assert tree.isdir("/a/b/c/d")
+
+    def test_single_descent(self, monkeypatch):
+        tree = Loopy().mkdir("/a/b", parents=True)
+        calls = []
+        descend = Loopy._descend
+        monkeypatch.setattr(Loopy, "_descend", lambda self, segs: calls.append(segs) or descend(self, segs))
+        tree.mkdir("/a/b/c/d", parents=True)
+        tree.mkdir("/e")
+        assert len(calls) == 2
+        assert tree.isdir("/a/b/c/d") and tree.isdir("/e")
+
+    def test_existing_path_is_noop(self):
+        tree = Loopy().mkdir("/a/b", parents=True)
+        raw = tree.raw
+        tree.mkdir("/a/b", parents=True)
+        assert tree.raw == raw
+
+    def test_missing_parent_without_parents(self):
+        with pytest.raises(KeyError):
+            Loopy().mkdir("/a/b")
+
+    def test_under_file(self):
+        tree = Loopy().touch("/f", "text")
+        with pytest.raises(NotADirectoryError):
+            tree.mkdir("/f/sub", parents=True)
+        with pytest.raises(NotADirectoryError):
+            tree.touch("/f/sub", "x")
+
+
+class TestClassify:
+    """Test file/directory classification."""
+
+    def test_ls_classify(self):
+        tree = Loopy("<root><empty></empty><leaf/><text>t</text><dir><x/></dir></root>")
+        assert tree.ls("/", classify=True) == ["empty/", "leaf", "text", "dir/"]
+
+    def test_ls_classify_duplicate_names(self):
+        tree = Loopy("<root><a>text</a><a><y/></a></root>")
+        assert tree.ls("/", classify=True) == ["a", "a/"]
+
+    def test_isdir_isfile_cd(self):
+        tree = Loopy().mkdir("/d").touch("/f", "x")
+        assert tree.isdir("/d") and not tree.isfile("/d")
+        assert tree.isfile("/f") and not tree.isdir("/f")
+        assert not tree.isdir("/missing") and not tree.isfile("/missing")
+        with pytest.raises(NotADirectoryError):
+            tree.cd("/f")
+        with pytest.raises(KeyError):
+            tree.cd("/missing")
+        assert tree.cd("/d").cwd == "/d"
+
+
+class TestDu:
+    """Test du's node counting."""
+
+    def test_count_ignores_escaped_text(self):
+        tree = Loopy().touch("/n", "<b>&</b>")
+        assert tree.du("/") == 2
+        assert tree.du("/n") == 1
+        assert tree.du("/", content_size=True) == len("<b>&</b>")
+
+    def test_count_subtree(self):
+        tree = Loopy().mkdir("/a/b", parents=True).touch("/a/b/c").touch("/a/d", "x")
+        assert tree.du("/") == 5
+        assert tree.du("/a") == 4
+        assert tree.du("/a/b/c") == 1
+
+
+class TestSed:
+    """Test sed's batched rewrite of _data."""
+
+    def setup_method(self):
+        self.tree = (
+            Loopy()
+            .touch("/a/one", "cat hat")
+            .touch("/a/skip", "dog")
+            .mkdir("/a/empty")
+            .touch("/a/leaf")
+            .touch("/b/c/two", "cat")
+            .touch("/b/three", "a cat and a cat")
+        )
+
+    def test_rewrites_non_adjacent_nodes(self):
+        self.tree.sed("/", "cat", "cow", recursive=True)
+        assert self.tree.cat("/a/one") == "cow hat"
+        assert self.tree.cat("/a/skip") == "dog"
+        assert self.tree.cat("/b/c/two") == "cow"
+        assert self.tree.cat("/b/three") == "a cow and a cow"
+        assert self.tree.ls("/a") == ["one", "skip", "empty", "leaf"]
+
+    def test_matches_node_engine(self):
+        node = NodeLoopy(self.tree.raw)
+        self.tree.sed("/", "a", "<&>", recursive=True, count=1)
+        node.sed("/", "a", "<&>", recursive=True, count=1)
+        assert self.tree.raw == node.raw
+
+    def test_escaping_survives_splice(self):
+        self.tree.sed("/", "cat", "<b>&amp;", recursive=True)
+        assert self.tree.cat("/a/one") == "<b>&amp; hat"
+        assert "<one>&lt;b&gt;&amp;amp; hat</one>" in self.tree.raw
+        assert self.tree.ls("/b") == ["c", "three"]
+
+    def test_nodes_without_text_untouched(self):
+        self.tree.sed("/", "^.*$", "filled", recursive=True)
+        assert "<empty></empty>" in self.tree.raw
+        assert "<leaf/>" in self.tree.raw
+        assert self.tree.isdir("/a/empty")
+        assert self.tree.cat("/a/skip") == "filled"
+
+    def test_non_recursive_only_touches_path(self):
+        self.tree.sed("/b/three", "cat", "cow")
+        assert self.tree.cat("/b/three") == "a cow and a cow"
+        assert self.tree.cat("/b/c/two") == "cat"
+
+    def test_directory_with_text_raises_before_mutating(self):
+        tree = Loopy("<root><a>cat</a><d>cat<c/></d></root>")
+        raw = tree.raw
+        with pytest.raises(IsADirectoryError):
+            tree.sed("/", "cat", "cow", recursive=True)
+        assert tree.raw == raw
+
+
+class TestGlob:
+    """Test glob scoping to the pattern's literal prefix."""
+
+    def setup_method(self):
+        self.tree = (
+            Loopy()
+            .touch("/src/m1/a.py", "x")
+            .touch("/src/m1/deep/b.py", "y")
+            .touch("/src/m2/c.py", "z")
+            .touch("/docs/a.py", "d")
+        )
+
+    def test_glob_scope(self):
+        assert glob_scope("/src/*/x") == (["src"], 3)
+        assert glob_scope("/a/b") == (["a", "b"], 2)
+        assert glob_scope("/src/**/x") == (["src"], None)
+        assert glob_scope("/a/[bc]/d") == (["a"], None)
+        assert glob_scope("/*/x") == ([], 2)
+        assert glob_scope("/a/b|/x/c") == ([], None)
+        assert glob_scope("/a/b|c") == ([], None)
+        assert glob_scope("/*|/x") == ([], None)
+        assert glob_scope("/src/(a|b)") == ([], None)
+
+    def test_alternation_is_not_scoped(self):
+        assert self.tree.glob("/src/m1/a.py|/docs/a.py") == ["/src/m1/a.py", "/docs/a.py"]
+        assert self.tree.glob("/docs/*|/src/m2/c.py") == ["/src/m2/c.py", "/docs/a.py"]
+
+    def test_literal_prefix(self):
+        assert self.tree.glob("/src/*/*.py") == ["/src/m1/a.py", "/src/m2/c.py"]
+        assert self.tree.glob("/src/m1/*", "/src") == ["/src/m1/a.py", "/src/m1/deep"]
+
+    def test_max_depth_stops_at_pattern_depth(self):
+        assert self.tree.glob("/src/*") == ["/src/m1", "/src/m2"]
+        assert self.tree.glob("/src/**/*.py") == [
+            "/src/m1/a.py",
+            "/src/m1/deep/b.py",
+            "/src/m2/c.py",
+        ]
+
+    def test_no_literal_prefix(self):
+        assert self.tree.glob("/*/a.py") == ["/docs/a.py"]
+        assert self.tree.glob("/**/*.py", "/src/m2") == ["/src/m2/c.py"]
+
+    def test_fully_literal(self):
+        assert self.tree.glob("/src/m1/a.py") == ["/src/m1/a.py"]
+        assert self.tree.glob("/src/m1/missing.py") == []
+
+    def test_start_path_outside_prefix(self):
+        assert self.tree.glob("/src/m1/a.py", "/docs") == []
+
+    def test_regex_segment_is_unbounded(self):
+        assert self.tree.glob("/src/m[12]/*.py") == ["/src/m1/a.py", "/src/m2/c.py"]
+
+    def test_relative_pattern_matches_nothing(self):
+        assert self.tree.glob("*.py") == []
+
+    def test_matches_node_engine(self):
+        node = NodeLoopy(self.tree.raw)
+        patterns = [
+            "/src/*/*.py",
+            "/**/a.py",
+            "/*",
+            "/src/m?/*",
+            "/docs/a.py",
+            "/(src|docs)/*",
+            "/src/m1/a.py|/docs/a.py",
+            "/src/m2/*|/docs",
+            "/*/a.py|/src/m1/deep/b.py",
+        ]
+        for pattern in patterns:
+            for path in ["/", "/src", "/src/m1"]:
+                assert self.tree.glob(pattern, path) == node.glob(pattern, path)
+
+
+class TestTree:
+    """Test tree rendering."""
+
+    def test_tree(self):
+        tree = Loopy().touch("/a/b", "x" * 60).mkdir("/c")
+        assert tree.tree("/") == "\n".join(
+            [
+                "root/",
+                "├── a/",
+                f"│   └── b: {'x' * 50}...",
+                "└── c/",
+            ]
+        )
@@ -0,0 +1,49 @@
+import importlib
+from pathlib import Path
+
+import pytest
+
+from loopy import Loopy
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def examples(monkeypatch):
+    # examples/ sits at the repo root, outside the installed package
+    monkeypatch.syspath_prepend(str(ROOT))
+    return importlib.import_module("examples")
+
+
+def test_every_example_loads(examples):
+    assert sorted(examples.__all__) == sorted(
+        path.stem for path in (ROOT / "examples").glob("*.loopy")
+    )
+    for name in examples.__all__:
+        loader = getattr(examples, name)
+        assert loader.__name__ == name
+        assert loader.__doc__
+        tree = loader()
+        assert isinstance(tree, Loopy)
+        assert tree.ls("/")
+        assert name in dir(examples)
+
+
+def test_unknown_example_raises(examples):
+    with pytest.raises(AttributeError, match="no_such_example"):
+        examples.no_such_example
+    assert not hasattr(examples, "_not_there")
+
+
+def test_each_call_returns_independent_copy(examples):
+    first = examples.product_catalog()
+    raw = first.raw
+    child = first.ls("/")[0]
+    first.rm(f"/{child}", recursive=True)
+    first.mkdir("/scratch")
+
+    second = examples.product_catalog()
+    assert second is not first
+    assert second.raw == raw
+    assert not second.exists("/scratch")
+    assert examples._load.cache_info().currsize >= 1
@@ -1,3 +1,8 @@
+import os
+import pickle
+import subprocess
+import sys
+
 from loopy import Loopy
 from loopy.file_store import FileBackedLoopy, load, save
 
@@ -31,3 +36,84 @@ def test_load_and_save(tmp_path):
 
     raw = path.read_text()
     assert "Ship a clean CLI" in raw
+
+
+class NamedFileBackedLoopy(FileBackedLoopy):
+    pass
+
+
+def test_pickle_round_trip(tmp_path):
+    path = tmp_path / "notes.loopy"
+    backed = FileBackedLoopy(path)
+    backed.touch("/ideas/cli", "Ship a clean CLI").cd("/ideas")
+    restored = pickle.loads(pickle.dumps(backed))
+    assert type(restored) is FileBackedLoopy
+    assert restored.path == path
+    assert restored.cwd == "/ideas"
+    assert restored.cat("/ideas/cli") == "Ship a clean CLI"
+
+
+def test_pickle_keeps_subclass(tmp_path):
+    path = tmp_path / "notes.loopy"
+    backed = NamedFileBackedLoopy(path).touch("/a", "text")
+    restored = pickle.loads(pickle.dumps(backed))
+    assert type(restored) is NamedFileBackedLoopy
+    assert restored.path == path
+    assert restored.cat("/a") == "text"
+
+
+def test_pickle_inside_batch(tmp_path):
+    path = tmp_path / "notes.loopy"
+    backed = FileBackedLoopy(path)
+    with backed.batch():
+        backed.touch("/a", "x")
+        restored = pickle.loads(pickle.dumps(backed))
+        backed.touch("/b", "y")
+    assert restored.cat("/a") == "x"
+    assert load(path).cat("/b") == "y"
+
+
+def test_copy_is_not_file_backed(tmp_path):
+    path = tmp_path / "notes.loopy"
+    backed = FileBackedLoopy(path).touch("/a", "text")
+    copy = backed.copy()
+    assert type(copy) is Loopy
+    copy.touch("/b", "scratch")
+    assert "scratch" not in path.read_text()
+
+
+def test_batch_defers_on_mutate(tmp_path):
+    calls: list[int] = []
+    tree = Loopy(on_mutate=lambda: calls.append(1))
+
+    with tree.batch():
+        tree.mkdir("/a/b", parents=True)
+        with tree.batch():
+            tree.touch("/a/b/c", "one")
+        tree.touch("/a/d", "two")
+        assert calls == []
+    assert len(calls) == 1
+
+    with tree.batch():
+        tree.ls("/")
+    assert len(calls) == 1
+
+    path = tmp_path / "notes.loopy"
+    backed = FileBackedLoopy(path)
+    with backed.batch():
+        for i in range(5):
+            backed.touch(f"/logs/{i}", f"entry {i}")
+        assert not path.exists()
+    assert load(path).cat("/logs/4") == "entry 4"
+
+
+def test_file_store_module_reachable_from_package():
+    # Run in a fresh interpreter: here loopy.file_store is already imported
+    code = (
+        "import sys, loopy\n"
+        "assert 'loopy.file_store' not in sys.modules\n"
+        "assert 'file_store' in dir(loopy)\n"
+        "assert loopy.file_store.FileBackedLoopy is loopy.FileBackedLoopy\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)